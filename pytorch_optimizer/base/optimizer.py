@@ -1,6 +1,6 @@
 import math
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import torch
 from torch.optim import Optimizer
@@ -25,6 +25,8 @@ class BaseOptimizer(ABC, Optimizer):
     def __init__(self, params: PARAMETERS, defaults: DEFAULTS) -> None:
         super().__init__(params, defaults)
 
+        self.device_steps: Dict[Tuple[int, torch.device], Tuple[GROUP, int, torch.Tensor]] = {}
+
     @staticmethod
     def load_optimizer(optimizer: OPTIMIZER_INSTANCE_OR_CLASS, **kwargs) -> Optimizer:
         r"""Build torch.optim.Optimizer class."""
@@ -147,7 +149,7 @@ class BaseOptimizer(ABC, Optimizer):
         :param fixed_decay: bool. fix weight decay.
         :param ratio: Optional[float]. scale weight decay.
         """
-        if weight_decouple:
+        if weight_decouple and weight_decay != 0.0:
             p.mul_(1.0 - weight_decay * (1.0 if fixed_decay else lr) * (ratio if ratio is not None else 1.0))
         elif weight_decay > 0.0 and grad is not None:
             grad.add_(p, alpha=weight_decay)
@@ -188,6 +190,61 @@ class BaseOptimizer(ABC, Optimizer):
         """
         return 1.0 - math.pow(beta, step)  # fmt: skip
 
+    @staticmethod
+    def debias_incremental(group: GROUP) -> Tuple[float, float]:
+        r"""Adam-style debias corrections of the group, tracking `beta ** step` incrementally.
+
+        The powers are kept in the group and multiplied by the betas every step. They are recomputed with `pow` for
+        checkpoints without them, or when the betas or the step have changed since they were last updated. Returns
+        `1.0 - beta1 ** step, 1.0 - beta2 ** step`.
+
+        :param group: GROUP. parameter group. `step` must be already incremented.
+        """
+        beta1, beta2 = group['betas']
+
+        if (
+            'beta1_pow' in group
+            and tuple(group.get('pow_betas', ())) == (beta1, beta2)
+            and group.get('pow_step') == group['step'] - 1
+        ):
+            group['beta1_pow'] *= beta1
+            group['beta2_pow'] *= beta2
+        else:
+            group['beta1_pow'] = math.pow(beta1, group['step'])
+            group['beta2_pow'] = math.pow(beta2, group['step'])
+            group['pow_betas'] = (beta1, beta2)
+
+        group['pow_step'] = group['step']
+
+        return 1.0 - group['beta1_pow'], 1.0 - group['beta2_pow']
+
+    def get_device_step(self, group: GROUP, device: torch.device) -> torch.Tensor:
+        r"""Get the step of the group as a 0-d float32 tensor on the device, for the fused kernels.
+
+        One tensor is kept per group and device, and it is incremented on the device once per step. so every param of
+        the group sees the same step as `group['step']`, whether it has a gradient or not, and the kernels never read a
+        changing host value. It is kept out of the state dict and rebuilt from `group['step']` when out of sync.
+
+        :param group: GROUP. parameter group. `step` must be already incremented.
+        :param device: torch.device. device of the parameters.
+        """
+        key: Tuple[int, torch.device] = (id(group), device)
+
+        entry = self.device_steps.get(key)
+        if entry is not None and entry[0] is group:
+            _, step, step_t = entry
+            if step == group['step']:
+                return step_t
+            if step == group['step'] - 1:
+                step_t.add_(1.0)
+                self.device_steps[key] = (group, group['step'], step_t)
+                return step_t
+
+        step_t = torch.full((), group['step'], dtype=torch.float32, device=device)
+        self.device_steps[key] = (group, group['step'], step_t)
+
+        return step_t
+
     @staticmethod
     def debias_beta(beta: float, step: int) -> float:
         r"""Apply the Adam-style debias correction into beta.
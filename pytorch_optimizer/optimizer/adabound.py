@@ -1,11 +1,16 @@
 import math
-from typing import List
+import warnings
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
 import torch
 
 from pytorch_optimizer.base.exception import NoSparseGradientError
 from pytorch_optimizer.base.optimizer import BaseOptimizer
 from pytorch_optimizer.base.type import BETAS, CLOSURE, DEFAULTS, GROUP, LOSS, PARAMETERS
+from pytorch_optimizer.optimizer.triton_utils import adabound_update_triton, is_triton_supported
+
+BUCKET_KEY = Tuple[torch.device, torch.dtype]
 
 
 class AdaBound(BaseOptimizer):
@@ -22,6 +27,11 @@ class AdaBound(BaseOptimizer):
     :param ams_bound: bool. whether to use the AMSBound variant.
     :param eps: float. term added to the denominator to improve numerical stability.
     :param maximize: bool. maximize the objective with respect to the params, instead of minimizing.
+    :param fused: bool. whether to fuse the update into a single Triton kernel. only takes effect when CUDA is available,
+        `triton` is installed and all the parameters of the group are contiguous fp32, fp16 or bf16 CUDA tensors. other
+        groups use the multi-tensor implementation.
+    :param foreach: Optional[bool]. whether to use the multi-tensor (`torch._foreach_*`) implementation. if None, it is
+        used when all the parameters of the group are on CUDA.
     """
 
     def __init__(
@@ -37,6 +47,8 @@ class AdaBound(BaseOptimizer):
         ams_bound: bool = False,
         eps: float = 1e-8,
         maximize: bool = False,
+        fused: bool = False,
+        foreach: Optional[bool] = None,
         **kwargs,
     ):
         self.validate_learning_rate(lr)
@@ -44,7 +56,18 @@ class AdaBound(BaseOptimizer):
         self.validate_non_negative(weight_decay, 'weight_decay')
         self.validate_non_negative(eps, 'eps')
 
+        if fused and foreach:
+            raise ValueError('`fused` and `foreach` cannot be True at the same time.')
+
         self.maximize = maximize
+        self.fused = fused and torch.cuda.is_available()
+
+        if fused and not self.fused:
+            warnings.warn(
+                '`fused=True` requires CUDA. falling back to the non-fused implementation.',
+                category=UserWarning,
+                stacklevel=2,
+            )
 
         defaults: DEFAULTS = {
             'lr': lr,
@@ -56,6 +79,8 @@ class AdaBound(BaseOptimizer):
             'fixed_decay': fixed_decay,
             'ams_bound': ams_bound,
             'eps': eps,
+            'foreach': foreach,
+            'fused': self.fused,
         }
 
         super().__init__(params, defaults)
@@ -66,6 +91,7 @@ class AdaBound(BaseOptimizer):
         return 'AdaBound'
 
     def init_group(self, group: GROUP, **kwargs) -> None:
+        new_states: List[torch.Tensor] = []
         for p in group['params']:
             if p.grad is None:
                 continue
@@ -77,10 +103,205 @@ class AdaBound(BaseOptimizer):
             state = self.state[p]
 
             if len(state) == 0:
-                state['exp_avg'] = torch.zeros_like(p)
-                state['exp_avg_sq'] = torch.zeros_like(p)
+                state['exp_avg'] = torch.empty_like(p)
+                state['exp_avg_sq'] = torch.empty_like(p)
+                new_states.extend((state['exp_avg'], state['exp_avg_sq']))
                 if group['ams_bound']:
-                    state['max_exp_avg_sq'] = torch.zeros_like(p)
+                    state['max_exp_avg_sq'] = torch.empty_like(p)
+                    new_states.append(state['max_exp_avg_sq'])
+
+        if len(new_states) > 0:
+            torch._foreach_zero_(new_states)
+
+    def _single_tensor_step(self, group: GROUP, step_size: float, lower_bound: float, upper_bound: float) -> None:
+        beta1, beta2 = group['betas']
+        beta1_comp, beta2_comp = 1.0 - beta1, 1.0 - beta2
+
+        lr, eps, ams_bound = group['lr'], group['eps'], group['ams_bound']
+        weight_decay, weight_decouple, fixed_decay = (
+            group['weight_decay'],
+            group['weight_decouple'],
+            group['fixed_decay'],
+        )
+
+        for p in group['params']:
+            if p.grad is None:
+                continue
+
+            grad = p.grad
+
+            self.maximize_gradient(grad, maximize=self.maximize)
+
+            state = self.state[p]
+
+            self.apply_weight_decay(
+                p=p,
+                grad=grad,
+                lr=lr,
+                weight_decay=weight_decay,
+                weight_decouple=weight_decouple,
+                fixed_decay=fixed_decay,
+            )
+
+            exp_avg, exp_avg_sq = state['exp_avg'], state['exp_avg_sq']
+            p, grad, exp_avg, exp_avg_sq = self.view_as_real(p, grad, exp_avg, exp_avg_sq)
+
+            exp_avg.mul_(beta1).add_(grad, alpha=beta1_comp)
+            exp_avg_sq.mul_(beta2).addcmul_(grad, grad, value=beta2_comp)
+
+            de_nom = self.apply_ams_bound(
+                ams_bound=ams_bound,
+                exp_avg_sq=exp_avg_sq,
+                max_exp_avg_sq=state.get('max_exp_avg_sq', None),
+                eps=eps,
+            )
+
+            de_nom.reciprocal_().mul_(step_size).clamp_(min=lower_bound, max=upper_bound).mul_(exp_avg)
+
+            p.sub_(de_nom)
+
+    def _get_tensor_buckets(self, group: GROUP) -> Dict[BUCKET_KEY, Dict[str, List[torch.Tensor]]]:
+        r"""Get the tensor lists of the params with grad, bucketed by (device, dtype). built every step.
+
+        `raw_params` holds the original parameters, `params` and the states hold their real views.
+        """
+        buckets: Dict[BUCKET_KEY, Dict[str, List[torch.Tensor]]] = defaultdict(
+            lambda: {'raw_params': [], 'params': [], 'exp_avg': [], 'exp_avg_sq': [], 'max_exp_avg_sq': []}
+        )
+        for p in group['params']:
+            if p.grad is None:
+                continue
+
+            state = self.state[p]
+            bucket = buckets[(p.device, p.dtype)]
+
+            bucket['raw_params'].append(p)
+
+            p, exp_avg, exp_avg_sq, max_exp_avg_sq = self.view_as_real(
+                p, state['exp_avg'], state['exp_avg_sq'], state.get('max_exp_avg_sq', None)
+            )
+
+            bucket['params'].append(p)
+            bucket['exp_avg'].append(exp_avg)
+            bucket['exp_avg_sq'].append(exp_avg_sq)
+            if group['ams_bound']:
+                bucket['max_exp_avg_sq'].append(max_exp_avg_sq)
+
+        return dict(buckets)
+
+    def _collect_tensors(self, group: GROUP) -> List[Tuple[Dict[str, List[torch.Tensor]], List[torch.Tensor]]]:
+        r"""Get the buckets paired with their gradients, after applying maximize and the weight decay."""
+        buckets: List[Tuple[Dict[str, List[torch.Tensor]], List[torch.Tensor]]] = []
+        for bucket in self._get_tensor_buckets(group).values():
+            params: List[torch.Tensor] = bucket['params']
+            grads: List[torch.Tensor] = [
+                torch.view_as_real(p.grad) if torch.is_complex(p.grad) else p.grad for p in bucket['raw_params']
+            ]
+
+            if self.maximize:
+                torch._foreach_neg_(grads)
+
+            if group['weight_decouple'] and group['weight_decay'] != 0.0:
+                torch._foreach_mul_(
+                    params, 1.0 - group['weight_decay'] * (1.0 if group['fixed_decay'] else group['lr'])
+                )
+            elif group['weight_decay'] > 0.0:
+                torch._foreach_add_(grads, params, alpha=group['weight_decay'])
+
+            buckets.append((bucket, grads))
+
+        return buckets
+
+    @staticmethod
+    def _apply_bounded_update(
+        params: List[torch.Tensor],
+        exp_avgs: List[torch.Tensor],
+        exp_avg_sqs: List[torch.Tensor],
+        max_exp_avg_sqs: Optional[List[torch.Tensor]],
+        eps: float,
+        step_size: float,
+        lower_bound: float,
+        upper_bound: float,
+    ) -> None:
+        de_noms = torch._foreach_add(max_exp_avg_sqs if max_exp_avg_sqs else exp_avg_sqs, 1e-15)
+
+        torch._foreach_sqrt_(de_noms)
+        torch._foreach_add_(de_noms, eps)
+
+        torch._foreach_reciprocal_(de_noms)
+        torch._foreach_mul_(de_noms, step_size)
+        torch._foreach_clamp_min_(de_noms, lower_bound)
+        torch._foreach_clamp_max_(de_noms, upper_bound)
+        torch._foreach_mul_(de_noms, exp_avgs)
+
+        torch._foreach_sub_(params, de_noms)
+
+    def _multi_tensor_step(self, group: GROUP, step_size: float, lower_bound: float, upper_bound: float) -> None:
+        beta1, beta2 = group['betas']
+
+        for bucket, grads in self._collect_tensors(group):
+            exp_avgs, exp_avg_sqs, max_exp_avg_sqs = bucket['exp_avg'], bucket['exp_avg_sq'], bucket['max_exp_avg_sq']
+
+            torch._foreach_mul_(exp_avgs, beta1)
+            torch._foreach_add_(exp_avgs, grads, alpha=1.0 - beta1)
+
+            torch._foreach_mul_(exp_avg_sqs, beta2)
+            torch._foreach_addcmul_(exp_avg_sqs, grads, grads, value=1.0 - beta2)
+
+            if group['ams_bound']:
+                torch._foreach_maximum_(max_exp_avg_sqs, exp_avg_sqs)
+
+            self._apply_bounded_update(
+                bucket['params'],
+                exp_avgs,
+                exp_avg_sqs,
+                max_exp_avg_sqs,
+                group['eps'],
+                step_size,
+                lower_bound,
+                upper_bound,
+            )
+
+    def _fused_step(self, group: GROUP, final_lr: float) -> None:
+        beta1, beta2 = group['betas']
+
+        lr, eps = group['lr'], group['eps']
+        weight_decay, weight_decouple, fixed_decay = (
+            group['weight_decay'],
+            group['weight_decouple'],
+            group['fixed_decay'],
+        )
+
+        decay: float = 1.0 - weight_decay * (1.0 if fixed_decay else lr) if weight_decouple else 1.0
+        l2_decay: float = 0.0 if weight_decouple else weight_decay
+
+        for p in group['params']:
+            if p.grad is None:
+                continue
+
+            grad = p.grad
+
+            self.maximize_gradient(grad, maximize=self.maximize)
+
+            state = self.state[p]
+
+            adabound_update_triton(
+                p,
+                grad,
+                state['exp_avg'],
+                state['exp_avg_sq'],
+                state.get('max_exp_avg_sq', None),
+                self.get_device_step(group, p.device),
+                lr,
+                final_lr,
+                group['gamma'],
+                beta1,
+                beta2,
+                eps,
+                decay,
+                l2_decay,
+                group.get('adam_debias', False),
+            )
 
     @torch.no_grad()
     def step(self, closure: CLOSURE = None) -> LOSS:
@@ -96,10 +317,8 @@ class AdaBound(BaseOptimizer):
             else:
                 group['step'] += 1
 
-            beta1, beta2 = group['betas']
-
-            bias_correction1: float = self.debias(beta1, group['step'])
-            bias_correction2_sq: float = math.sqrt(self.debias(beta2, group['step']))
+            bias_correction1, bias_correction2 = self.debias_incremental(group)
+            bias_correction2_sq: float = math.sqrt(bias_correction2)
 
             final_lr: float = group['final_lr'] * group['lr'] / base_lr
             lower_bound: float = final_lr * (1 - 1 / (group['gamma'] * group['step'] + 1))
@@ -111,41 +330,19 @@ class AdaBound(BaseOptimizer):
                 bias_correction1=bias_correction1,
             )
 
-            for p in group['params']:
-                if p.grad is None:
-                    continue
-
-                grad = p.grad
-
-                self.maximize_gradient(grad, maximize=self.maximize)
-
-                state = self.state[p]
-
-                self.apply_weight_decay(
-                    p=p,
-                    grad=grad,
-                    lr=group['lr'],
-                    weight_decay=group['weight_decay'],
-                    weight_decouple=group['weight_decouple'],
-                    fixed_decay=group['fixed_decay'],
-                )
-
-                exp_avg, exp_avg_sq = state['exp_avg'], state['exp_avg_sq']
-                p, grad, exp_avg, exp_avg_sq = self.view_as_real(p, grad, exp_avg, exp_avg_sq)
-
-                exp_avg.mul_(beta1).add_(grad, alpha=1.0 - beta1)
-                exp_avg_sq.mul_(beta2).addcmul_(grad, grad, value=1.0 - beta2)
-
-                de_nom = self.apply_ams_bound(
-                    ams_bound=group['ams_bound'],
-                    exp_avg_sq=exp_avg_sq,
-                    max_exp_avg_sq=state.get('max_exp_avg_sq', None),
-                    eps=group['eps'],
-                )
-
-                update = torch.full_like(de_nom, fill_value=step_size)
-                update.div_(de_nom).clamp_(min=lower_bound, max=upper_bound).mul_(exp_avg)
-
-                p.add_(-update)
+            foreach: Optional[bool] = group.get('foreach')
+            if foreach is None:
+                foreach = all(p.is_cuda for p in group['params'])
+
+            if self.fused and all(
+                is_triton_supported(p, p.grad, self.state[p]['exp_avg'], self.state[p]['exp_avg_sq'])
+                for p in group['params']
+                if p.grad is not None
+            ):
+                self._fused_step(group, final_lr)
+            elif self.fused or foreach:
+                self._multi_tensor_step(group, step_size, lower_bound, upper_bound)
+            else:
+                self._single_tensor_step(group, step_size, lower_bound, upper_bound)
 
         return loss
@@ -0,0 +1,249 @@
+import os
+from typing import Optional
+
+import torch
+
+from pytorch_optimizer.optimizer.utils import HAS_TRITON
+
+BLOCK_SIZE: int = 1024
+
+if HAS_TRITON:  # pragma: no cover
+    import triton
+    import triton.language as tl
+
+    @triton.jit
+    def debias(beta, step):
+        r"""Adam-style debias correction computed on device. Returns `1.0 - beta ** step`."""
+        return 1.0 - tl.exp2(step * tl.log2(beta))
+
+    @triton.jit
+    def yogi_kernel(
+        p_ptr,
+        grad_ptr,
+        exp_avg_ptr,
+        exp_avg_sq_ptr,
+        step_ptr,
+        n_elements,
+        lr,
+        beta1,
+        beta2,
+        eps,
+        decay,
+        l2_decay,
+        ADAM_DEBIAS: tl.constexpr,  # noqa: N803
+        BLOCK_SIZE: tl.constexpr,  # noqa: N803
+    ):
+        r"""Fused Yogi kernel. moments, denominator and parameter update are computed in registers."""
+        step = tl.load(step_ptr).to(tl.float32)
+
+        bias_correction2_sq = tl.sqrt(debias(beta2, step))
+        step_size = lr if ADAM_DEBIAS else lr / debias(beta1, step)
+
+        offsets = tl.program_id(0) * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
+        mask = offsets < n_elements
+
+        p = tl.load(p_ptr + offsets, mask=mask).to(tl.float32)
+        grad = tl.load(grad_ptr + offsets, mask=mask).to(tl.float32)
+        exp_avg = tl.load(exp_avg_ptr + offsets, mask=mask).to(tl.float32)
+        exp_avg_sq = tl.load(exp_avg_sq_ptr + offsets, mask=mask).to(tl.float32)
+
+        grad = grad + l2_decay * p
+        p = p * decay
+
+        exp_avg = beta1 * exp_avg + (1.0 - beta1) * grad
+
+        grad_p2 = grad * grad
+        diff = exp_avg_sq - grad_p2
+        sign = tl.where(diff > 0.0, 1.0, tl.where(diff < 0.0, -1.0, 0.0))
+        exp_avg_sq = exp_avg_sq - (1.0 - beta2) * sign * grad_p2
+
+        de_nom = tl.sqrt(exp_avg_sq) / bias_correction2_sq + eps
+        p = p - step_size * exp_avg / de_nom
+
+        tl.store(p_ptr + offsets, p.to(p_ptr.dtype.element_ty), mask=mask)
+        tl.store(exp_avg_ptr + offsets, exp_avg.to(exp_avg_ptr.dtype.element_ty), mask=mask)
+        tl.store(exp_avg_sq_ptr + offsets, exp_avg_sq.to(exp_avg_sq_ptr.dtype.element_ty), mask=mask)
+
+    @triton.jit
+    def adabound_kernel(
+        p_ptr,
+        grad_ptr,
+        exp_avg_ptr,
+        exp_avg_sq_ptr,
+        max_exp_avg_sq_ptr,
+        step_ptr,
+        n_elements,
+        lr,
+        final_lr,
+        gamma,
+        beta1,
+        beta2,
+        eps,
+        decay,
+        l2_decay,
+        AMS_BOUND: tl.constexpr,  # noqa: N803
+        ADAM_DEBIAS: tl.constexpr,  # noqa: N803
+        BLOCK_SIZE: tl.constexpr,  # noqa: N803
+    ):
+        r"""Fused AdaBound kernel. moments, clamped step size and parameter update are computed in registers."""
+        step = tl.load(step_ptr).to(tl.float32)
+
+        step_size = lr * tl.sqrt(debias(beta2, step))
+        if not ADAM_DEBIAS:
+            step_size = step_size / debias(beta1, step)
+
+        lower_bound = final_lr * (1.0 - 1.0 / (gamma * step + 1.0))
+        upper_bound = final_lr * (1.0 + 1.0 / (gamma * step))
+
+        offsets = tl.program_id(0) * BLOCK_SIZE + tl.arange(0, BLOCK_SIZE)
+        mask = offsets < n_elements
+
+        p = tl.load(p_ptr + offsets, mask=mask).to(tl.float32)
+        grad = tl.load(grad_ptr + offsets, mask=mask).to(tl.float32)
+        exp_avg = tl.load(exp_avg_ptr + offsets, mask=mask).to(tl.float32)
+        exp_avg_sq = tl.load(exp_avg_sq_ptr + offsets, mask=mask).to(tl.float32)
+
+        grad = grad + l2_decay * p
+        p = p * decay
+
+        exp_avg = beta1 * exp_avg + (1.0 - beta1) * grad
+        exp_avg_sq = beta2 * exp_avg_sq + (1.0 - beta2) * grad * grad
+
+        if AMS_BOUND:
+            max_exp_avg_sq = tl.load(max_exp_avg_sq_ptr + offsets, mask=mask).to(tl.float32)
+            max_exp_avg_sq = tl.maximum(max_exp_avg_sq, exp_avg_sq)
+            tl.store(max_exp_avg_sq_ptr + offsets, max_exp_avg_sq.to(max_exp_avg_sq_ptr.dtype.element_ty), mask=mask)
+            de_nom = tl.sqrt(max_exp_avg_sq + 1e-15) + eps
+        else:
+            de_nom = tl.sqrt(exp_avg_sq + 1e-15) + eps
+
+        update = tl.minimum(tl.maximum(step_size / de_nom, lower_bound), upper_bound)
+        p = p - update * exp_avg
+
+        tl.store(p_ptr + offsets, p.to(p_ptr.dtype.element_ty), mask=mask)
+        tl.store(exp_avg_ptr + offsets, exp_avg.to(exp_avg_ptr.dtype.element_ty), mask=mask)
+        tl.store(exp_avg_sq_ptr + offsets, exp_avg_sq.to(exp_avg_sq_ptr.dtype.element_ty), mask=mask)
+
+
+def is_triton_supported(*tensors: torch.Tensor) -> bool:
+    r"""Check whether the tensors can be handled by the Triton kernels.
+
+    CPU tensors are accepted when `TRITON_INTERPRET=1`, which runs the kernels with the Triton interpreter.
+
+    :param tensors: torch.Tensor. tensors to check.
+    """
+    interpret: bool = os.environ.get('TRITON_INTERPRET', '0') == '1'
+    return HAS_TRITON and all(
+        (t.is_cuda or interpret) and t.is_contiguous() and t.dtype in (torch.float32, torch.float16, torch.bfloat16)
+        for t in tensors
+    )
+
+
+def yogi_update_triton(
+    p: torch.Tensor,
+    grad: torch.Tensor,
+    exp_avg: torch.Tensor,
+    exp_avg_sq: torch.Tensor,
+    step: torch.Tensor,
+    lr: float,
+    beta1: float,
+    beta2: float,
+    eps: float,
+    decay: float,
+    l2_decay: float,
+    adam_debias: bool,
+) -> None:
+    r"""Apply the Yogi update in-place with the fused Triton kernel.
+
+    :param p: torch.Tensor. parameter.
+    :param grad: torch.Tensor. gradient.
+    :param exp_avg: torch.Tensor. exp_avg.
+    :param exp_avg_sq: torch.Tensor. exp_avg_sq.
+    :param step: torch.Tensor. number of steps (already incremented) on the device. bias corrections are computed from
+        it in the kernel, so that no host value changes across steps.
+    :param lr: float. learning rate.
+    :param beta1: float. beta1.
+    :param beta2: float. beta2.
+    :param eps: float. term added to the denominator to improve numerical stability.
+    :param decay: float. multiplier of the parameter for the decoupled weight decay. 1.0 disables it.
+    :param l2_decay: float. coefficient of the L2 penalty added to the gradient. 0.0 disables it.
+    :param adam_debias: bool. only correct the denominator to avoid inflating step sizes early in training.
+    """
+    n_elements: int = p.numel()
+
+    yogi_kernel[(triton.cdiv(n_elements, BLOCK_SIZE),)](
+        p,
+        grad,
+        exp_avg,
+        exp_avg_sq,
+        step,
+        n_elements,
+        lr,
+        beta1,
+        beta2,
+        eps,
+        decay,
+        l2_decay,
+        ADAM_DEBIAS=adam_debias,
+        BLOCK_SIZE=BLOCK_SIZE,
+    )
+
+
+def adabound_update_triton(
+    p: torch.Tensor,
+    grad: torch.Tensor,
+    exp_avg: torch.Tensor,
+    exp_avg_sq: torch.Tensor,
+    max_exp_avg_sq: Optional[torch.Tensor],
+    step: torch.Tensor,
+    lr: float,
+    final_lr: float,
+    gamma: float,
+    beta1: float,
+    beta2: float,
+    eps: float,
+    decay: float,
+    l2_decay: float,
+    adam_debias: bool,
+) -> None:
+    r"""Apply the AdaBound update in-place with the fused Triton kernel.
+
+    :param p: torch.Tensor. parameter.
+    :param grad: torch.Tensor. gradient.
+    :param exp_avg: torch.Tensor. exp_avg.
+    :param exp_avg_sq: torch.Tensor. exp_avg_sq.
+    :param max_exp_avg_sq: Optional[torch.Tensor]. max_exp_avg_sq. AMSBound variant is used when given.
+    :param step: torch.Tensor. number of steps (already incremented) on the device. bias corrections and bounds are
+        computed from it in the kernel, so that no host value changes across steps.
+    :param lr: float. learning rate.
+    :param final_lr: float. final learning rate.
+    :param gamma: float. convergence speed of the bound functions.
+    :param beta1: float. beta1.
+    :param beta2: float. beta2.
+    :param eps: float. term added to the denominator to improve numerical stability.
+    :param decay: float. multiplier of the parameter for the decoupled weight decay. 1.0 disables it.
+    :param l2_decay: float. coefficient of the L2 penalty added to the gradient. 0.0 disables it.
+    :param adam_debias: bool. only correct the denominator to avoid inflating step sizes early in training.
+    """
+    n_elements: int = p.numel()
+
+    adabound_kernel[(triton.cdiv(n_elements, BLOCK_SIZE),)](
+        p,
+        grad,
+        exp_avg,
+        exp_avg_sq,
+        max_exp_avg_sq if max_exp_avg_sq is not None else exp_avg_sq,
+        step,
+        n_elements,
+        lr,
+        final_lr,
+        gamma,
+        beta1,
+        beta2,
+        eps,
+        decay,
+        l2_decay,
+        AMS_BOUND=max_exp_avg_sq is not None,
+        ADAM_DEBIAS=adam_debias,
+        BLOCK_SIZE=BLOCK_SIZE,
+    )
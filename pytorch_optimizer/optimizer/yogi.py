@@ -1,10 +1,49 @@
 import math
+import warnings
+from typing import Dict, List, Optional, Tuple
 
 import torch
 
 from pytorch_optimizer.base.exception import NoSparseGradientError
 from pytorch_optimizer.base.optimizer import BaseOptimizer
-from pytorch_optimizer.base.type import BETAS, CLOSURE, DEFAULTS, GROUP, LOSS, PARAMETERS
+from pytorch_optimizer.base.type import BETAS, CLOSURE, DEFAULTS, GROUP, LOSS, PARAMETERS, STATE
+from pytorch_optimizer.optimizer.triton_utils import is_triton_supported, yogi_update_triton
+
+
+def yogi_update(
+    p: torch.Tensor,
+    grad: torch.Tensor,
+    exp_avg: torch.Tensor,
+    exp_avg_sq: torch.Tensor,
+    beta1: float,
+    beta2: float,
+    eps: float,
+    bias_correction2_sq: torch.Tensor,
+    step_size: torch.Tensor,
+) -> None:
+    r"""Apply the Yogi update in-place. Kept as a standalone function so that `torch.compile` can fuse it.
+
+    :param p: torch.Tensor. parameter.
+    :param grad: torch.Tensor. gradient.
+    :param exp_avg: torch.Tensor. exp_avg.
+    :param exp_avg_sq: torch.Tensor. exp_avg_sq.
+    :param beta1: float. beta1.
+    :param beta2: float. beta2.
+    :param eps: float. term added to the denominator to improve numerical stability.
+    :param bias_correction2_sq: torch.Tensor. square root of the bias correction of the second moment.
+    :param step_size: torch.Tensor. step size.
+    """
+    grad_p2 = grad * grad
+
+    # written out-of-place and copied back at the end so the whole update is traced into a single fused graph.
+    next_exp_avg = exp_avg * beta1 + grad * (1.0 - beta1)
+    next_exp_avg_sq = exp_avg_sq - torch.sign(exp_avg_sq - grad_p2) * grad_p2 * (1.0 - beta2)
+
+    de_nom = next_exp_avg_sq.sqrt() / bias_correction2_sq + eps
+
+    exp_avg.copy_(next_exp_avg)
+    exp_avg_sq.copy_(next_exp_avg_sq)
+    p.copy_(p - next_exp_avg / de_nom * step_size)
 
 
 class Yogi(BaseOptimizer):
@@ -19,6 +58,13 @@ class Yogi(BaseOptimizer):
     :param fixed_decay: bool. fix weight decay.
     :param eps: float. term added to the denominator to improve numerical stability.
     :param maximize: bool. maximize the objective with respect to the params, instead of minimizing.
+    :param fused: bool. whether to fuse the element-wise update into a single kernel. only takes effect when CUDA is
+        available and all the parameters of the group are fp32, fp16 or bf16 CUDA tensors, others use the foreach or
+        single-tensor implementation. contiguous tensors use the Triton kernel when `triton` is installed, others use
+        `torch.compile`.
+    :param foreach: Optional[bool]. whether to use the multi-tensor (`torch._foreach_*`) implementation. if None, it is
+        used when all the parameters of the group are on CUDA. complex parameters always use the single-tensor
+        implementation.
     """
 
     def __init__(
@@ -32,6 +78,8 @@ class Yogi(BaseOptimizer):
         fixed_decay: bool = False,
         eps: float = 1e-3,
         maximize: bool = False,
+        fused: bool = False,
+        foreach: Optional[bool] = None,
         **kwargs,
     ):
         self.validate_learning_rate(lr)
@@ -39,7 +87,20 @@ class Yogi(BaseOptimizer):
         self.validate_non_negative(weight_decay, 'weight_decay')
         self.validate_non_negative(eps, 'eps')
 
+        if fused and foreach:
+            raise ValueError('`fused` and `foreach` cannot be True at the same time.')
+
         self.maximize = maximize
+        self.fused = fused and torch.cuda.is_available()
+
+        if fused and not self.fused:
+            warnings.warn(
+                '`fused=True` requires CUDA. falling back to the non-fused implementation.',
+                category=UserWarning,
+                stacklevel=2,
+            )
+
+        self._compiled_update = torch.compile(yogi_update, fullgraph=True, dynamic=True) if self.fused else None
 
         defaults: DEFAULTS = {
             'lr': lr,
@@ -49,15 +110,25 @@ class Yogi(BaseOptimizer):
             'fixed_decay': fixed_decay,
             'initial_accumulator': initial_accumulator,
             'eps': eps,
+            'foreach': foreach,
+            'fused': self.fused,
             **kwargs,
         }
 
         super().__init__(params, defaults)
 
+        # per-parameter scratch buffers of the single-tensor path. kept out of `self.state` so they are not serialized.
+        self._scratch: Dict[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]] = {}
+
     def __str__(self) -> str:
         return 'Yogi'
 
+    def load_state_dict(self, state_dict: STATE) -> None:
+        super().load_state_dict(state_dict)
+        self._scratch = {}
+
     def init_group(self, group: GROUP, **kwargs) -> None:
+        new_states: List[torch.Tensor] = []
         for p in group['params']:
             if p.grad is None:
                 continue
@@ -69,8 +140,163 @@ class Yogi(BaseOptimizer):
             state = self.state[p]
 
             if len(state) == 0:
-                state['exp_avg'] = torch.full_like(grad, fill_value=group['initial_accumulator'])
-                state['exp_avg_sq'] = torch.full_like(grad, fill_value=group['initial_accumulator'])
+                state['exp_avg'] = torch.empty_like(grad)
+                state['exp_avg_sq'] = torch.empty_like(grad)
+                new_states.extend((state['exp_avg'], state['exp_avg_sq']))
+
+        if len(new_states) > 0:
+            torch._foreach_zero_(new_states)
+            torch._foreach_add_(new_states, group['initial_accumulator'])
+
+    def _single_tensor_step(self, group: GROUP, step_size: float, bias_correction2_sq: float) -> None:
+        beta1, beta2 = group['betas']
+        beta1_comp, beta2_comp = 1.0 - beta1, 1.0 - beta2
+
+        lr, eps = group['lr'], group['eps']
+        weight_decay, weight_decouple, fixed_decay = (
+            group['weight_decay'],
+            group['weight_decouple'],
+            group['fixed_decay'],
+        )
+
+        for p in group['params']:
+            if p.grad is None:
+                continue
+
+            grad = p.grad
+
+            self.maximize_gradient(grad, maximize=self.maximize)
+
+            state = self.state[p]
+
+            self.apply_weight_decay(
+                p=p,
+                grad=grad,
+                lr=lr,
+                weight_decay=weight_decay,
+                weight_decouple=weight_decouple,
+                fixed_decay=fixed_decay,
+            )
+
+            scratch = self._scratch.get(p)
+            if (
+                scratch is None
+                or scratch[0].shape != grad.shape
+                or scratch[0].dtype != grad.dtype
+                or scratch[0].device != grad.device
+            ):
+                scratch = self._scratch[p] = (torch.empty_like(grad), torch.empty_like(grad))
+
+            grad_p2_buffer, tmp_buffer = scratch
+
+            grad_p2 = torch.mul(grad, grad, out=grad_p2_buffer)
+
+            exp_avg, exp_avg_sq = state['exp_avg'], state['exp_avg_sq']
+            exp_avg.mul_(beta1).add_(grad, alpha=beta1_comp)
+
+            sign = torch.sub(exp_avg_sq, grad_p2, out=tmp_buffer)
+            sign = sign.sign_() if not torch.is_complex(exp_avg_sq) else sign.sgn_()
+
+            exp_avg_sq.addcmul_(sign, grad_p2, value=-beta2_comp)
+
+            # `sign` is consumed at this point, so its buffer is reused for the denominator.
+            de_nom = torch.sqrt(exp_avg_sq, out=tmp_buffer).div_(bias_correction2_sq).add_(eps)
+
+            p.addcdiv_(exp_avg, de_nom, value=-step_size)
+
+    def _multi_tensor_step(self, group: GROUP, step_size: float, bias_correction2_sq: float) -> None:
+        beta1, beta2 = group['betas']
+
+        params: List[torch.Tensor] = [p for p in group['params'] if p.grad is not None]
+        if len(params) == 0:
+            return
+
+        grads: List[torch.Tensor] = [p.grad for p in params]
+        exp_avgs: List[torch.Tensor] = [self.state[p]['exp_avg'] for p in params]
+        exp_avg_sqs: List[torch.Tensor] = [self.state[p]['exp_avg_sq'] for p in params]
+
+        if self.maximize:
+            torch._foreach_neg_(grads)
+
+        if group['weight_decouple'] and group['weight_decay'] != 0.0:
+            torch._foreach_mul_(params, 1.0 - group['weight_decay'] * (1.0 if group['fixed_decay'] else group['lr']))
+        elif group['weight_decay'] > 0.0:
+            torch._foreach_add_(grads, params, alpha=group['weight_decay'])
+
+        torch._foreach_mul_(exp_avgs, beta1)
+        torch._foreach_add_(exp_avgs, grads, alpha=1.0 - beta1)
+
+        grad_p2 = torch._foreach_mul(grads, grads)
+
+        signs = torch._foreach_sub(exp_avg_sqs, grad_p2)
+        torch._foreach_sign_(signs)
+
+        torch._foreach_addcmul_(exp_avg_sqs, signs, grad_p2, value=-(1.0 - beta2))
+
+        de_noms = torch._foreach_sqrt(exp_avg_sqs)
+        torch._foreach_div_(de_noms, bias_correction2_sq)
+        torch._foreach_add_(de_noms, group['eps'])
+
+        torch._foreach_addcdiv_(params, exp_avgs, de_noms, value=-step_size)
+
+    def _fused_step(self, group: GROUP, step_size: float, bias_correction2_sq: float) -> None:
+        beta1, beta2 = group['betas']
+
+        lr, eps = group['lr'], group['eps']
+        weight_decay, weight_decouple, fixed_decay = (
+            group['weight_decay'],
+            group['weight_decouple'],
+            group['fixed_decay'],
+        )
+
+        decay: float = 1.0 - weight_decay * (1.0 if fixed_decay else lr) if weight_decouple else 1.0
+        l2_decay: float = 0.0 if weight_decouple else weight_decay
+
+        scalars: Dict[torch.device, Tuple[torch.Tensor, torch.Tensor]] = {}
+        for p in group['params']:
+            if p.grad is None:
+                continue
+
+            grad = p.grad
+
+            self.maximize_gradient(grad, maximize=self.maximize)
+
+            state = self.state[p]
+
+            if is_triton_supported(p, grad, state['exp_avg'], state['exp_avg_sq']):
+                yogi_update_triton(
+                    p,
+                    grad,
+                    state['exp_avg'],
+                    state['exp_avg_sq'],
+                    self.get_device_step(group, p.device),
+                    lr,
+                    beta1,
+                    beta2,
+                    eps,
+                    decay,
+                    l2_decay,
+                    group.get('adam_debias', False),
+                )
+            else:  # pragma: no cover
+                self.apply_weight_decay(
+                    p=p,
+                    grad=grad,
+                    lr=lr,
+                    weight_decay=weight_decay,
+                    weight_decouple=weight_decouple,
+                    fixed_decay=fixed_decay,
+                )
+
+                if p.device not in scalars:
+                    scalars[p.device] = (
+                        torch.full((), bias_correction2_sq, device=p.device),
+                        torch.full((), step_size, device=p.device),
+                    )
+
+                self._compiled_update(
+                    p, grad, state['exp_avg'], state['exp_avg_sq'], beta1, beta2, eps, *scalars[p.device]
+                )
 
     @torch.no_grad()
     def step(self, closure: CLOSURE = None) -> LOSS:
@@ -86,50 +312,27 @@ class Yogi(BaseOptimizer):
             else:
                 group['step'] += 1
 
-            beta1, beta2 = group['betas']
-
-            bias_correction1: float = self.debias(beta1, group['step'])
-            bias_correction2_sq: float = math.sqrt(self.debias(beta2, group['step']))
+            bias_correction1, bias_correction2 = self.debias_incremental(group)
+            bias_correction2_sq: float = math.sqrt(bias_correction2)
 
             step_size: float = self.apply_adam_debias(
                 adam_debias=group.get('adam_debias', False), step_size=group['lr'], bias_correction1=bias_correction1
             )
 
-            for p in group['params']:
-                if p.grad is None:
-                    continue
-
-                grad = p.grad
+            foreach: Optional[bool] = group.get('foreach')
+            if foreach is None:
+                foreach = all(p.is_cuda for p in group['params'])
 
-                self.maximize_gradient(grad, maximize=self.maximize)
+            has_complex: bool = any(torch.is_complex(p) for p in group['params'])
 
-                state = self.state[p]
-
-                self.apply_weight_decay(
-                    p=p,
-                    grad=grad,
-                    lr=group['lr'],
-                    weight_decay=group['weight_decay'],
-                    weight_decouple=group['weight_decouple'],
-                    fixed_decay=group['fixed_decay'],
-                )
-
-                grad_p2 = grad.mul(grad)
-
-                exp_avg, exp_avg_sq = state['exp_avg'], state['exp_avg_sq']
-                exp_avg.mul_(beta1).add_(grad, alpha=1.0 - beta1)
-                exp_avg_sq.addcmul_(
-                    (
-                        (exp_avg_sq - grad_p2).sign_()
-                        if not torch.is_complex(exp_avg_sq)
-                        else (exp_avg_sq - grad_p2).sgn_()
-                    ),
-                    grad_p2,
-                    value=-(1.0 - beta2),
-                )
-
-                de_nom = exp_avg_sq.sqrt().div_(bias_correction2_sq).add_(group['eps'])
-
-                p.addcdiv_(exp_avg, de_nom, value=-step_size)
+            if self.fused and all(
+                is_triton_supported(p) or (p.is_cuda and p.dtype in (torch.float32, torch.float16, torch.bfloat16))
+                for p in group['params']
+            ):
+                self._fused_step(group, step_size, bias_correction2_sq)
+            elif foreach and not has_complex:
+                self._multi_tensor_step(group, step_size, bias_correction2_sq)
+            else:
+                self._single_tensor_step(group, step_size, bias_correction2_sq)
 
         return loss
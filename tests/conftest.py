@@ -1,9 +1,13 @@
+import importlib
 from typing import Tuple
 
 import numpy as np
 import pytest
 import torch
 
+from pytorch_optimizer.optimizer import triton_utils
+from pytorch_optimizer.optimizer.utils import HAS_TRITON
+
 
 @pytest.fixture(scope='session')
 def environment(num_samples: int = 100, dims: int = 2, seed: int = 42) -> Tuple[torch.Tensor, torch.Tensor]:
@@ -12,14 +16,27 @@ def environment(num_samples: int = 100, dims: int = 2, seed: int = 42) -> Tuple[
 
     x = rng.randn(num_samples, dims) * 2
 
-    # center the first N/2 points at (-2, -2)
+    # center the first N/2 points at (-2, -2) and the last N/2 points at (2, 2)
     mid: int = num_samples // 2
-    x[:mid, :] = x[:mid, :] - 2 * np.ones((mid, dims))
-
-    # center the last N/2 points at (2, 2)
-    x[mid:, :] = x[mid:, :] + 2 * np.ones((mid, dims))
+    x[:mid] -= 2.0
+    x[mid:] += 2.0
 
     # labels: first N/2 are 0, last N/2 are 1
-    y = np.array([0] * mid + [1] * mid).reshape(100, 1)
+    y = (np.arange(num_samples) >= mid).reshape(-1, 1)
+
+    return torch.from_numpy(x).float(), torch.from_numpy(y).float()
+
+
+@pytest.fixture
+def triton_interpreter(monkeypatch):
+    r"""Run the Triton kernels with the Triton interpreter, so the fused paths can be tested on CPU."""
+    if not HAS_TRITON:
+        pytest.skip('triton is not installed')
+
+    monkeypatch.setenv('TRITON_INTERPRET', '1')
+    importlib.reload(triton_utils)
+
+    yield
 
-    return torch.Tensor(x), torch.Tensor(y)
+    monkeypatch.delenv('TRITON_INTERPRET')
+    importlib.reload(triton_utils)
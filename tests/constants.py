@@ -282,6 +282,7 @@ OPTIMIZERS: List[Tuple[Any, Dict[str, Union[float, bool, int]], int]] = [
     (AdaBound, {'lr': 1e0, 'gamma': 0.1, 'weight_decay': 1e-3, 'fixed_decay': True}, 20),
     (AdaBound, {'lr': 1e0, 'gamma': 0.1, 'weight_decay': 1e-3, 'weight_decouple': False}, 20),
     (AdaBound, {'lr': 1e0, 'gamma': 0.1, 'weight_decay': 1e-3, 'ams_bound': True}, 20),
+    (AdaBound, {'lr': 1e0, 'gamma': 0.1, 'weight_decay': 1e-3, 'ams_bound': True, 'foreach': True}, 20),
     (Adai, {'lr': 5e0, 'weight_decay': 0.0, 'use_gc': True}, 5),
     (Adai, {'lr': 5e-1, 'weight_decay': 0.0, 'dampening': 0.9}, 5),
     (Adai, {'lr': 5e-1, 'weight_decay': 1e-4, 'weight_decouple': False}, 5),
@@ -504,6 +505,7 @@ OPTIMIZERS: List[Tuple[Any, Dict[str, Union[float, bool, int]], int]] = [
     (ASGD, {'lr': 5e-1, 'weight_decay': 1e-3}, 5),
     (ASGD, {'lr': 5e-1, 'weight_decay': 1e-3, 'weight_decouple': False}, 5),
     (Yogi, {'lr': 5e-1, 'weight_decay': 1e-3}, 5),
+    (Yogi, {'lr': 5e-1, 'weight_decay': 1e-3, 'foreach': True}, 5),
     (Fromage, {'lr': 5e-1, 'p_bound': 2.0}, 5),
     (MSVAG, {'lr': 5e-1}, 10),
     (AdaMod, {'lr': 5e1, 'weight_decay': 1e-3}, 10),
@@ -54,6 +54,21 @@ def test_came_parameters():
         opt(None, eps2=-1e-6)
 
 
+@pytest.mark.parametrize('optimizer_name', ['adabound', 'yogi'])
+def test_fused_parameters(optimizer_name):
+    if torch.cuda.is_available():
+        pytest.skip(f'fused {optimizer_name} is available')
+
+    with pytest.warns(UserWarning):
+        load_optimizer(optimizer_name)([simple_parameter()], fused=True)
+
+
+@pytest.mark.parametrize('optimizer_name', ['adabound', 'yogi'])
+def test_foreach_fused_parameters(optimizer_name):
+    with pytest.raises(ValueError):
+        load_optimizer(optimizer_name)([simple_parameter()], fused=True, foreach=True)
+
+
 def test_pcgrad_parameters():
     opt = load_optimizer('adamw')([simple_parameter()])
 
@@ -60,6 +60,8 @@ def test_adamd_variant(optimizer_config, environment):
 
     optimizer = optimizer_class(model.parameters(), **config, adam_debias=True)
 
+    create_graph: bool = optimizer_class.__name__ in ('AdaHessian',)
+
     init_loss, loss = np.inf, np.inf
     for _ in range(num_iterations):
         optimizer.zero_grad()
@@ -70,7 +72,7 @@ def test_adamd_variant(optimizer_config, environment):
         if init_loss == np.inf:
             init_loss = loss
 
-        loss.backward(create_graph=optimizer_class.__name__ in ('AdaHessian',))
+        loss.backward(create_graph=create_graph)
 
         optimizer.step()
 
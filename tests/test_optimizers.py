@@ -70,6 +70,8 @@ def test_f32_optimizers(optimizer_fp32_config, environment):
     if optimizer_name.endswith('schedulefree'):
         optimizer.train()
 
+    create_graph: bool = optimizer_name in ('AdaHessian', 'SophiaH')
+
     init_loss, loss = np.inf, np.inf
     for _ in range(iterations):
         optimizer.zero_grad()
@@ -79,7 +81,7 @@ def test_f32_optimizers(optimizer_fp32_config, environment):
         if init_loss == np.inf:
             init_loss = loss
 
-        loss.backward(create_graph=optimizer_name in ('AdaHessian', 'SophiaH'))
+        loss.backward(create_graph=create_graph)
 
         optimizer.step(closure(loss) if optimizer_name == 'AliG' or optimizer_name.startswith('Emo') else None)
 
@@ -113,6 +115,8 @@ def test_bf16_optimizers(optimizer_bf16_config, environment):
     context = torch.autocast('cpu', dtype=torch.bfloat16)
     scaler = torch.GradScaler(device='cpu', enabled=False)
 
+    create_graph: bool = optimizer_name in ('AdaHessian', 'SophiaH')
+
     init_loss, loss = np.inf, np.inf
     for _ in range(iterations):
         optimizer.zero_grad()
@@ -123,7 +127,7 @@ def test_bf16_optimizers(optimizer_bf16_config, environment):
         if init_loss == np.inf:
             init_loss = loss
 
-        scaler.scale(loss).backward(create_graph=optimizer_name in ('AdaHessian', 'SophiaH'))
+        scaler.scale(loss).backward(create_graph=create_graph)
 
         optimizer.step(closure(loss) if optimizer_name == 'AliG' or optimizer_name.startswith('Emo') else None)
 
@@ -156,6 +160,8 @@ def test_complex_optimizers(optimizer_complex_config, environment):
     if optimizer_name.endswith('schedulefree'):
         optimizer.train()
 
+    create_graph: bool = optimizer_name in ('adahessian', 'sophiah')
+
     init_loss, loss = np.inf, np.inf
     for _ in range(iterations):
         optimizer.zero_grad()
@@ -165,7 +171,7 @@ def test_complex_optimizers(optimizer_complex_config, environment):
         if init_loss == np.inf:
             init_loss = loss
 
-        loss.backward(create_graph=optimizer_name in ('adahessian', 'sophiah'))
+        loss.backward(create_graph=create_graph)
 
         optimizer.step(closure(loss) if optimizer_name == 'alig' or optimizer_name.startswith('emo') else None)
 
@@ -628,3 +634,193 @@ def test_emoneco_optimizer():
     optimizer.state[p]['ema'] = {'short': 0.0847 / 0.7, 'long': 0.0}
 
     optimizer.step()
+
+
+def test_yogi_buffers_not_in_state():
+    p = simple_parameter(True)
+    optimizer = load_optimizer('yogi')([p], foreach=False)
+    optimizer.step()
+
+    assert set(optimizer.state_dict()['state'][0].keys()) == {'exp_avg', 'exp_avg_sq'}
+
+
+def test_yogi_scratch_dtype_change():
+    p = simple_parameter(True)
+    optimizer = load_optimizer('yogi')([p], foreach=False)
+    optimizer.step()
+
+    state_dict = optimizer.state_dict()
+
+    p.data = p.data.double()
+    p.grad = torch.ones_like(p)
+
+    optimizer.load_state_dict(state_dict)
+    assert not optimizer._scratch
+
+    optimizer.step()
+
+    assert optimizer._scratch[p][0].dtype == torch.float64
+    assert optimizer.state[p]['exp_avg_sq'].dtype == torch.float64
+
+
+def test_adabound_foreach_replaced_state():
+    p = simple_parameter(True)
+    p.grad = torch.ones_like(p)
+
+    optimizer = load_optimizer('adabound')([p], foreach=True)
+    optimizer.step()
+
+    optimizer.state[p]['exp_avg'] = torch.zeros_like(p)
+    optimizer.step()
+
+    assert optimizer.state[p]['exp_avg'].abs().sum() > 0.0
+
+
+PARITY_CONFIGS = [
+    {'weight_decay': 1e-2},
+    {'weight_decay': 1e-2, 'weight_decouple': False},
+    {'weight_decay': 1e-2, 'fixed_decay': True},
+    {'maximize': True},
+    {'adam_debias': True},
+]
+
+
+@pytest.mark.parametrize(
+    'optimizer_name,config',
+    [(optimizer_name, config) for optimizer_name in ('AdaBound', 'Yogi') for config in PARITY_CONFIGS]
+    + [('AdaBound', {'ams_bound': True})],
+)
+@pytest.mark.parametrize('dtype', [torch.float32, torch.complex64])
+def test_foreach_parity(optimizer_name, config, dtype):
+    def run(foreach: bool) -> list:
+        torch.manual_seed(42)
+        params = [torch.randn(4, 3, dtype=dtype, requires_grad=True), torch.randn(3, dtype=dtype, requires_grad=True)]
+
+        optimizer = load_optimizer(optimizer_name)(params, lr=1e-1, foreach=foreach, **config)
+        for _ in range(5):
+            optimizer.zero_grad()
+            sum((p.abs() ** 2).sum() for p in params).backward()
+            optimizer.step()
+
+        return [p.detach() for p in params]
+
+    for single, multi in zip(run(foreach=False), run(foreach=True)):
+        torch.testing.assert_close(single, multi)
+
+
+@pytest.mark.parametrize('optimizer_name', ['AdaBound', 'Yogi'])
+def test_beta_powers_fallback(optimizer_name):
+    def build():
+        torch.manual_seed(42)
+        params = [torch.randn(4, 3, requires_grad=True)]
+        return params, load_optimizer(optimizer_name)(params, lr=1e-1)
+
+    def train(params, optimizer, num_steps: int, betas=None):
+        for _ in range(num_steps):
+            if betas is not None:
+                optimizer.param_groups[0]['betas'] = betas
+            optimizer.zero_grad()
+            (params[0] ** 2).sum().backward()
+            optimizer.step()
+
+    baseline_params, baseline = build()
+    train(baseline_params, baseline, 5)
+
+    params, optimizer = build()
+    train(params, optimizer, 2)
+
+    state_dict = optimizer.state_dict()
+    for key in ('beta1_pow', 'beta2_pow', 'pow_betas', 'pow_step'):
+        state_dict['param_groups'][0].pop(key)
+
+    optimizer.load_state_dict(state_dict)
+    train(params, optimizer, 3)
+
+    torch.testing.assert_close(params[0], baseline_params[0], rtol=0.0, atol=1e-6)
+    assert optimizer.param_groups[0]['beta1_pow'] == pytest.approx(0.9**5)
+
+    params, optimizer = build()
+    train(params, optimizer, 2)
+    train(params, optimizer, 1, betas=(0.8, 0.99))
+
+    assert optimizer.param_groups[0]['beta1_pow'] == pytest.approx(0.8**3)
+    assert optimizer.param_groups[0]['beta2_pow'] == pytest.approx(0.99**3)
+
+    optimizer.param_groups[0]['step'] = 0
+    train(params, optimizer, 1, betas=(0.8, 0.99))
+
+    assert optimizer.param_groups[0]['beta1_pow'] == pytest.approx(0.8)
+    assert optimizer.param_groups[0]['beta2_pow'] == pytest.approx(0.99)
+
+
+@pytest.mark.parametrize('optimizer_name', ['AdaBound', 'Yogi'])
+def test_device_step(optimizer_name):
+    p = simple_parameter(True)
+
+    optimizer = load_optimizer(optimizer_name)([p])
+    optimizer.step()
+    optimizer.step()
+
+    assert 'fused' in optimizer.param_groups[0]
+    assert 'step' not in optimizer.state[p]
+
+    group = optimizer.param_groups[0]
+
+    step = optimizer.get_device_step(group, p.device)
+    assert step.item() == 2.0
+    assert step.dtype == torch.float32
+    assert step.device == p.device
+
+    group['step'] += 1
+    assert optimizer.get_device_step(group, p.device) is step
+    assert optimizer.get_device_step(group, p.device).item() == 3.0
+
+    group['step'] = 10
+    assert optimizer.get_device_step(group, p.device).item() == 10.0
+
+
+@pytest.mark.parametrize('optimizer_name', ['AdaBound', 'Yogi'])
+def test_fused_sparse_gradient_steps(optimizer_name, triton_interpreter):
+    def run(fused: bool) -> list:
+        torch.manual_seed(42)
+        params = [torch.randn(4, 3, requires_grad=True), torch.randn(3, requires_grad=True)]
+
+        optimizer = load_optimizer(optimizer_name)(params, lr=1e-1, foreach=False)
+        optimizer.fused = fused
+
+        for i in range(6):
+            optimizer.zero_grad()
+            loss = (params[0] ** 2).sum()
+            if i % 2 == 0:
+                loss = loss + (params[1] ** 2).sum()
+            loss.backward()
+            optimizer.step()
+
+        return [p.detach() for p in params]
+
+    for eager, fused in zip(run(fused=False), run(fused=True)):
+        torch.testing.assert_close(eager, fused, rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    'optimizer_name,config',
+    [(optimizer_name, config) for optimizer_name in ('AdaBound', 'Yogi') for config in PARITY_CONFIGS]
+    + [('AdaBound', {'ams_bound': True}), ('AdaBound', {'ams_bound': True, 'weight_decay': 1e-2})],
+)
+def test_fused_parity(optimizer_name, config, triton_interpreter):
+    def run(fused: bool) -> list:
+        torch.manual_seed(42)
+        params = [torch.randn(4, 3, requires_grad=True), torch.randn(3, requires_grad=True)]
+
+        optimizer = load_optimizer(optimizer_name)(params, lr=1e-1, foreach=False, **config)
+        optimizer.fused = fused
+
+        for _ in range(5):
+            optimizer.zero_grad()
+            sum((p**2).sum() for p in params).backward()
+            optimizer.step()
+
+        return [p.detach() for p in params]
+
+    for eager, fused in zip(run(fused=False), run(fused=True)):
+        torch.testing.assert_close(eager, fused, rtol=1e-5, atol=1e-5)